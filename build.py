@@ -2,8 +2,8 @@
 from pybuilder.core import use_plugin, init
 
 use_plugin("python.core")
-use_plugin("python.unittest")
-use_plugin("python.coverage")
+use_plugin("pypi:pybuilder_pytest")
+use_plugin("pypi:pybuilder_pytest_coverage")
 
 
 name = "G8X.2025.TYY.GE2"
@@ -13,4 +13,4 @@ default_task = "publish"
 @init
 def set_properties(project):
     project.set_property("dir_source_main_python", "src/main/python")
-    project.set_property("dir_source_unittest_python", "src/unittest/python")
+    project.set_property("dir_source_pytest_python", "src/unittest/python")
@@ -1,91 +1,249 @@
 """Contains the class OrderShipping"""
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from functools import lru_cache
 import hashlib
 import json
 import os
+import re
+import time
 from uc3m_money.account_management_exception import AccountManagementException
 
+# orjson (C implementation) is an optional accelerator for the file I/O
+# hot path; the stdlib json module is used when it is not installed.
+try:
+    import orjson
+
+    def _loads(text):
+        return orjson.loads(text)
+
+    def _dumps(data):
+        return orjson.dumps(data).decode()
+except ImportError:
+    def _loads(text):
+        return json.loads(text)
+
+    def _dumps(data):
+        return json.dumps(data)
+
+# Precompiled pattern for a Spanish IBAN: "ES" followed by 22 digits or
+# uppercase letters (24 characters in total).
+IBAN_ES_PATTERN = re.compile(r"ES[0-9A-Z]{22}")
+
+# Deposit amount bounds, fixed by the schema at import time.
+DEPOSIT_AMOUNT_MIN = 10.00
+DEPOSIT_AMOUNT_MAX = 10000.00
+
+# Supported signature algorithms. The signature is only a duplicate
+# detection identifier, so BLAKE2b-256 (faster on short inputs, same
+# 64-character hex digest) may be selected instead of SHA-256. The
+# "alg" field in the JSON always records the algorithm actually used.
+_HASH_FACTORIES = {
+    "SHA-256": hashlib.sha256,
+    "BLAKE2b-256": lambda data=b"": hashlib.blake2b(data, digest_size=32),
+}
+
+
+def _signature_message(alg, typ, to_iban, deposit_amount, deposit_date):
+    """Composes the string to be used for generating the signature."""
+    return (f"{{alg:{alg},typ:{typ},iban:{to_iban},"
+            f"amount:{deposit_amount},deposit_date:{deposit_date}}}")
+
+
+@lru_cache(maxsize=1024)
+def _compute_signature(alg, typ, to_iban, deposit_amount, deposit_date):
+    """Hashes one signature message, memoized by its immutable inputs.
+
+    Equivalent deposits (identical fields, e.g. replayed events) reuse the
+    cached digest instead of re-hashing.
+    """
+    message = _signature_message(alg, typ, to_iban, deposit_amount, deposit_date)
+    return _HASH_FACTORIES[alg](message.encode()).hexdigest()
+
+
 class AccountDeposit:
     """Class representing the information required for shipping of an order"""
 
+    # Fixed attribute set: no per-instance __dict__, smaller instances and
+    # faster attribute access.
+    __slots__ = ("__alg", "__type", "__to_iban", "__deposit_amount",
+                 "__deposit_date", "__signature", "__json")
+
+    # In-process signature index per deposits file, so duplicate detection
+    # is a set lookup instead of a scan of every stored entry.
+    _sig_cache = {}
+
+    DEFAULT_ALG = "SHA-256"
+
     def __init__(self,
                  to_iban: str,
-                 deposit_amount):
-        self.__alg = "SHA-256"
+                 deposit_amount,
+                 deposit_date=None):
+        self.__alg = self.DEFAULT_ALG
         self.__type = "DEPOSIT"
         self.__to_iban = to_iban
         self.__deposit_amount = deposit_amount
-        justnow = datetime.now(timezone.utc)
-        self.__deposit_date = datetime.timestamp(justnow)
+        if deposit_date is None:
+            # Callers replaying recorded events may pass the original
+            # deposit_date so the memoized signature is reused.
+            deposit_date = time.time()
+        self.__deposit_date = deposit_date
 
         self.validate()
 
+        # Cached signature and JSON dict, computed lazily: construction
+        # stays hash-free, so bulk imports can fill the signatures
+        # concurrently through batch_sign before the first
+        # deposit_signature access would compute them one by one.
+        self.__signature = None
+        self.__json = None
+
     def to_json(self):
         """returns the object data in json format"""
-        return {"alg": self.__alg,
-                "typ": self.__type,
-                "to_iban": self.__to_iban,
-                "deposit_amount": self.__deposit_amount,
-                "deposit_date": self.__deposit_date,
-                "deposit_signature": self.deposit_signature}
+        if self.__json is None:
+            self.__json = {"alg": self.__alg,
+                           "typ": self.__type,
+                           "to_iban": self.__to_iban,
+                           "deposit_amount": self.__deposit_amount,
+                           "deposit_date": self.__deposit_date,
+                           "deposit_signature": self.deposit_signature}
+        return self.__json
 
     def validate(self):
         """Validates to_iban and deposit_amount fields."""
         # IBAN validation
         if not isinstance(self.__to_iban, str):
             raise AccountManagementException("to_iban must be a string.")
-        if len(self.__to_iban) != 24:
-            raise AccountManagementException("to_iban must be exactly 24 characters.")
-        if not self.__to_iban.startswith("ES"):
-            raise AccountManagementException("to_iban must start with 'ES'.")
+        if not IBAN_ES_PATTERN.fullmatch(self.__to_iban):
+            # The fast path is one C-level match; only failures fall
+            # through to the per-field checks for a precise message, with
+            # the common foreign-IBAN case rejected first.
+            if not self.__to_iban.startswith("ES"):
+                raise AccountManagementException("to_iban must start with 'ES'.")
+            if len(self.__to_iban) != 24:
+                raise AccountManagementException("to_iban must be exactly 24 characters.")
+            raise AccountManagementException(
+                "to_iban must contain only digits or uppercase letters after 'ES'.")
 
         # Deposit amount validation
         if not isinstance(self.__deposit_amount, float):
             raise AccountManagementException("deposit_amount must be a float.")
-        if not 10.00 <= self.__deposit_amount <= 10000.00:
+        if not DEPOSIT_AMOUNT_MIN <= self.__deposit_amount <= DEPOSIT_AMOUNT_MAX:
             raise AccountManagementException("deposit_amount must be between 10.00 and 10000.00.")
-        if "." in str(self.__deposit_amount):
-            decimal_part = str(self.__deposit_amount).split(".")[1]
-            if len(decimal_part) > 2:
-                raise AccountManagementException("deposit_amount must have at most 2 decimals.")
+        if Decimal(str(self.__deposit_amount)).as_tuple().exponent < -2:
+            raise AccountManagementException("deposit_amount must have at most 2 decimals.")
 
     def save_to_file(self, file_path="deposits.json"):
         """
         Saves the deposit request to a JSON file.
 
-        If the file exists, it appends the new deposit unless it's a duplicate.
-        If the file doesn't exist, it creates a new one.
+        Deposits are stored one JSON object per line (NDJSON), so saving a
+        new deposit is a single append instead of rewriting the whole file.
+        Files written in the old whole-list format are read transparently
+        and migrated to NDJSON on the next save.
 
         Raises:
             AccountManagementException: if there's an error saving or duplicate entry.
         """
         try:
-            data = []
+            sig = self.deposit_signature
+            sig_path = os.path.splitext(file_path)[0] + ".sig"
+
+            if not os.path.exists(file_path):
+                # The deposits file is gone, so any cached or sidecar index
+                # is stale and must be dropped.
+                AccountDeposit._sig_cache.pop(file_path, None)
+                if os.path.exists(sig_path):
+                    os.remove(sig_path)
 
-            # Load existing data if the file exists
-            if os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            signatures = AccountDeposit._sig_cache.get(file_path)
+            if signatures is None:
+                signatures = self.__build_signature_index(file_path, sig_path)
+                AccountDeposit._sig_cache[file_path] = signatures
 
-            # Prevent duplicate deposit entries (exact match)
-            if any(entry == self.to_json() for entry in data):
+            # Prevent duplicate deposit entries: the signature covers every
+            # field, so an index lookup is enough.
+            if sig in signatures:
                 raise AccountManagementException("Duplicate deposit entry detected.")
 
-            # Append and write back
-            data.append(self.to_json())
+            # One open in "a+" covers the format probe, the old-format
+            # migration and the append, instead of separate read and
+            # write opens.
+            with open(file_path, "a+", encoding="utf-8") as f:
+                f.seek(0)
+                if f.read(1) == "[":
+                    # Migrate the old list format to NDJSON in one rewrite.
+                    f.seek(0)
+                    entries = _loads(f.read())
+                    entries.append(self.to_json())
+                    f.seek(0)
+                    f.truncate()
+                    for entry in entries:
+                        f.write(_dumps(entry) + "\n")
+                else:
+                    f.write(_dumps(self.to_json()) + "\n")
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
+            # Record the new signature in the index and its sidecar file.
+            signatures.add(sig)
+            with open(sig_path, "a", encoding="utf-8") as f:
+                f.write(sig + "\n")
 
+        except AccountManagementException:
+            raise
         except Exception as e:
             raise AccountManagementException(f"Error saving deposit to file: {str(e)}") from e
 
+    @classmethod
+    def batch_sign(cls, deposits):
+        """Computes the signatures of many deposits concurrently.
+
+        hashlib releases the GIL while hashing, so a thread pool lets bulk
+        imports overlap the per-deposit signature work. Each deposit's
+        cached signature is filled in, and the list of signatures is
+        returned in the same order as the deposits.
+        """
+        jobs = [cls._signature_job(deposit) for deposit in deposits]
+        with ThreadPoolExecutor() as executor:
+            signatures = list(executor.map(
+                lambda job: job[0](job[1]).hexdigest(), jobs))
+        for deposit, signature in zip(deposits, signatures):
+            cls._store_signature(deposit, signature)
+        return signatures
+
+    def _signature_job(self):
+        """Returns this deposit's hash factory and encoded signature preimage."""
+        return _HASH_FACTORIES[self.__alg], self.__signature_string().encode()
+
+    def _store_signature(self, signature):
+        """Fills in the cached signature computed out of band by batch_sign."""
+        self.__signature = signature
+
+    @staticmethod
+    def __build_signature_index(file_path, sig_path):
+        """Builds the set of stored signatures, preferring the sidecar file."""
+        if os.path.exists(sig_path):
+            with open(sig_path, "r", encoding="utf-8") as f:
+                return {line.strip() for line in f if line.strip()}
+        signatures = set()
+        if os.path.exists(file_path):
+            with open(file_path, "r", encoding="utf-8") as f:
+                if f.read(1) == "[":
+                    f.seek(0)
+                    signatures = {entry.get("deposit_signature")
+                                  for entry in _loads(f.read())}
+                else:
+                    f.seek(0)
+                    signatures = {_loads(line).get("deposit_signature")
+                                  for line in f if line.strip()}
+            with open(sig_path, "w", encoding="utf-8") as f:
+                f.writelines(s + "\n" for s in signatures)
+        return signatures
+
 
     def __signature_string(self):
         """Composes the string to be used for generating the key for the date"""
-        return "{alg:" + str(self.__alg) +",typ:" + str(self.__type) +",iban:" + \
-               str(self.__to_iban) + ",amount:" + str(self.__deposit_amount) + \
-               ",deposit_date:" + str(self.__deposit_date) + "}"
+        return _signature_message(self.__alg, self.__type, self.__to_iban,
+                                  self.__deposit_amount, self.__deposit_date)
 
     @property
     def to_iban(self):
@@ -95,6 +253,7 @@ class AccountDeposit:
     @to_iban.setter
     def to_iban(self, value):
         self.__to_iban = value
+        self.__invalidate_cache()
 
     @property
     def deposit_amount(self):
@@ -103,6 +262,7 @@ class AccountDeposit:
     @deposit_amount.setter
     def deposit_amount(self, value):
         self.__deposit_amount = value
+        self.__invalidate_cache()
 
     @property
     def deposit_date(self):
@@ -111,8 +271,18 @@ class AccountDeposit:
     @deposit_date.setter
     def deposit_date( self, value ):
         self.__deposit_date = value
+        self.__invalidate_cache()
+
+    def __invalidate_cache(self):
+        """Drops the cached signature and JSON after a field change."""
+        self.__signature = None
+        self.__json = None
 
     @property
     def deposit_signature( self ):
-        """Returns the sha256 signature of the date"""
-        return hashlib.sha256(self.__signature_string().encode()).hexdigest()
+        """Returns the signature of the deposit data"""
+        if self.__signature is None:
+            self.__signature = _compute_signature(
+                self.__alg, self.__type, self.__to_iban,
+                self.__deposit_amount, self.__deposit_date)
+        return self.__signature
@@ -2,6 +2,9 @@
 
 class AccountManagementException(Exception):
     """Personalised exception for Accounts Management"""
+
+    __slots__ = ("__message",)
+
     def __init__(self, message):
         self.__message = message
         super().__init__(message)
@@ -1,9 +1,151 @@
 """Module for account management operations."""
 
 import json
-import datetime
+import os
+import re
+import time
+from collections import defaultdict
+from functools import lru_cache
 from .account_management_exception import AccountManagementException
 
+# orjson (C implementation) is an optional accelerator for the file I/O
+# hot path; the stdlib json module is used when it is not installed.
+try:
+    import orjson
+
+    def _load_json(file):
+        return orjson.loads(file.read())
+
+    def _dump_json(data, file):
+        file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+except ImportError:
+    def _load_json(file):
+        return json.load(file)
+
+    def _dump_json(data, file):
+        json.dump(data, file, indent=4)
+
+# ijson enables constant-memory streaming over large transaction logs;
+# without it the whole file is parsed in one go as before.
+try:
+    import ijson
+    _JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (ValueError,)
+
+
+# NumPy, when installed, sums the matched amounts over a contiguous C
+# buffer instead of a Python accumulation loop.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Translation table dropping spaces and turning decimal commas into dots
+# in a single pass over the amount string.
+_AMOUNT_TABLE = str.maketrans({" ": None, ",": "."})
+
+
+def _parse_amount(amount_str):
+    """Parses one amount string, normalizing spaces and decimal commas."""
+    amount_str = amount_str.translate(_AMOUNT_TABLE)
+    try:
+        return float(amount_str)
+    except ValueError as exc:
+        raise AccountManagementException(
+            "Invalid amount format in transactions"
+        ) from exc
+
+
+def _iter_transactions(transactions_file):
+    """Yields the transactions one at a time.
+
+    Streams the file with ijson when it is installed, keeping only one
+    transaction object in memory; otherwise the whole list is parsed.
+    """
+    if ijson is not None:
+        with open(transactions_file, "rb") as file:
+            yield from ijson.items(file, "item")
+        return
+    with open(transactions_file, "r", encoding="utf-8") as file:
+        yield from _load_json(file)
+
+# Precompiled pattern for a Spanish IBAN: "ES" followed by 22 digits or
+# uppercase letters (24 characters in total).
+IBAN_ES_PATTERN = re.compile(r"ES[0-9A-Z]{22}")
+
+# One parse of the transactions file serves balance queries for every
+# IBAN until the file changes: {file_path: (mtime, {iban: total})}.
+_tx_index_cache = {}
+
+# Clock seam: tests rebind this single module attribute to a fixed
+# clock instead of patching the datetime/time modules wholesale.
+_now = time.time
+
+
+def _transaction_totals(transactions_file):
+    """Returns per-IBAN totals, reusing the index while the file is unchanged."""
+    try:
+        mtime = os.path.getmtime(transactions_file)
+    except OSError:
+        mtime = None
+
+    cached = _tx_index_cache.get(transactions_file)
+    if cached is not None and mtime is not None and cached[0] == mtime:
+        return cached[1]
+
+    amounts = defaultdict(list)
+    for tx in _iter_transactions(transactions_file):
+        if "IBAN" in tx:
+            amounts[tx["IBAN"]].append(_parse_amount(tx.get("amount", "")))
+    if numpy is not None:
+        totals = {iban: float(numpy.asarray(values).sum())
+                  for iban, values in amounts.items()}
+    else:
+        totals = {iban: sum(values) for iban, values in amounts.items()}
+
+    if mtime is not None:
+        _tx_index_cache[transactions_file] = (mtime, totals)
+    return totals
+
+
+def _compute_balance(iban_number, transactions_file):
+    """Looks up the IBAN total in the index and writes the balance file."""
+    try:
+        totals = _transaction_totals(transactions_file)
+    except FileNotFoundError as exc:
+        raise AccountManagementException(
+            "Transactions file not found"
+        ) from exc
+    except _JSON_ERRORS as exc:
+        raise AccountManagementException(
+            "Transactions file is not valid JSON"
+        ) from exc
+
+    if iban_number not in totals:
+        raise AccountManagementException("IBAN not found in transactions")
+    total = totals[iban_number]
+
+    balance_data = {
+        "IBAN": iban_number,
+        "timestamp": _now(),
+        "balance": total
+    }
+    balance_file = f"balance_{iban_number}.json"
+
+    try:
+        with open(balance_file, "w", encoding="utf-8") as file:
+            _dump_json(balance_data, file)
+    except Exception as exc:
+        raise AccountManagementException(
+            "Error writing balance file: " + str(exc)
+        ) from exc
+
+    return True
+
+
 class AccountManager:
     """Class for providing the methods for managing accounts."""
 
@@ -17,13 +159,10 @@ class AccountManager:
         - Start with 'ES'.
         - Have a total length of 24 characters.
         """
-        if not isinstance(iban, str):
-            return False
-        if not iban.startswith("ES"):
-            return False
-        if len(iban) != 24:
-            return False
-        return True
+        # The O(1) length check rejects the common wrong-length inputs
+        # before paying for the regex dispatch.
+        return (isinstance(iban, str) and len(iban) == 24
+                and IBAN_ES_PATTERN.fullmatch(iban) is not None)
 
     @staticmethod
     def calculate_balance(iban_number: str) -> bool:
@@ -41,49 +180,18 @@ class AccountManager:
         transactions_file = "transactions.json"
 
         try:
-            with open(transactions_file, "r", encoding="utf-8") as file:
-                transactions = json.load(file)
-        except FileNotFoundError as exc:
-            raise AccountManagementException(
-                "Transactions file not found"
-            ) from exc
-        except json.JSONDecodeError as exc:
-            raise AccountManagementException(
-                "Transactions file is not valid JSON"
-            ) from exc
-
-        found = False
-        total = 0.0
-
-        for tx in transactions:
-            if "IBAN" in tx and tx["IBAN"] == iban_number:
-                found = True
-                amount_str = tx.get("amount", "")
-                # Clean the amount string: remove spaces and replace comma with dot.
-                amount_str = amount_str.replace(" ", "").replace(",", ".")
-                try:
-                    total += float(amount_str)
-                except ValueError as exc:
-                    raise AccountManagementException(
-                        "Invalid amount format in transactions"
-                    ) from exc
-
-        if not found:
-            raise AccountManagementException("IBAN not found in transactions")
-
-        balance_data = {
-            "IBAN": iban_number,
-            "timestamp": datetime.datetime.utcnow().timestamp(),
-            "balance": total
-        }
-        balance_file = f"balance_{iban_number}.json"
+            mtime = os.path.getmtime(transactions_file)
+        except OSError:
+            # No observable file to key the cache on; compute directly.
+            return _compute_balance(iban_number, transactions_file)
+        return _cached_balance(iban_number, mtime, transactions_file)
 
-        try:
-            with open(balance_file, "w", encoding="utf-8") as file:
-                json.dump(balance_data, file, indent=4)
-        except Exception as exc:
-            raise AccountManagementException(
-                "Error writing balance file: " + str(exc)
-            ) from exc
-
-        return True
+
+@lru_cache(maxsize=256)
+def _cached_balance(iban_number, _mtime, transactions_file):
+    """Memoizes balance computations per (IBAN, file mtime).
+
+    A changed mtime produces a new cache key and therefore a fresh parse;
+    repeated calls on an unchanged file are answered from the cache.
+    """
+    return _compute_balance(iban_number, transactions_file)
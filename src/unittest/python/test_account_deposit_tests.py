@@ -4,135 +4,149 @@
 This module tests the AccountDeposit class located in:
 src/main/python/uc3m_money/account_deposit.py
 
-Make sure your PYTHONPATH includes the main code directory.
-For example, from your project root run:
-    export PYTHONPATH=$(pwd)/src/main/python
-    python -m unittest discover -s src/unittest/python -p "test_account_deposit_tests.py"
+Run from the project root with:
+    python -m pytest src/unittest/python
 """
 
-import os
-import sys
-import unittest
+# pytest injects fixtures by matching test parameters against the
+# fixture names defined above them, which pylint reads as shadowing.
+# pylint: disable=redefined-outer-name
+
+import re
+from typing import Final
+
+import pytest
+
 from uc3m_money.account_deposit import AccountDeposit  # pylint: disable=import-error
 from uc3m_money.account_management_exception import AccountManagementException  # pylint: disable=import-error
 
-# Adjust sys.path so that the uc3m_money package is found.
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../main/python")))
-
-class TestAccountDeposit(unittest.TestCase):
-    """Test cases for the AccountDeposit class."""
-
-    def setUp(self):
-        """Set up test fixtures for AccountDeposit tests."""
-        self.valid_to_iban = "ES1234567890123456789012"
-        self.valid_deposit_amount = 100.00  # valid float between 10.00 and 10000.00
-        # Create an AccountDeposit instance with valid data.
-        self.ad = AccountDeposit(self.valid_to_iban, self.valid_deposit_amount)
-        # Use a dedicated file for testing file saving.
-        self.file_path = "deposits_test.json"
-        if os.path.exists(self.file_path):
-            os.remove(self.file_path)
-
-    def tearDown(self):
-        """Clean up test artifacts after tests."""
-        if os.path.exists(self.file_path):
-            os.remove(self.file_path)
-
-    def test_to_json_returns_expected_keys(self):
-        """Test that to_json returns a dictionary with all expected keys."""
-        result = self.ad.to_json()
-        expected_keys = {"alg", "typ", "to_iban", "deposit_amount",
-                         "deposit_date", "deposit_signature"}
-        self.assertEqual(set(result.keys()), expected_keys)
-
-    def test_deposit_signature_length(self):
-        """Test that the deposit signature is 64 characters long (SHA256 hash)."""
-        signature = self.ad.deposit_signature
-        self.assertEqual(len(signature), 64)
-
-    def test_to_iban_not_a_string(self):
-        """Test that a non-string to_iban raises an exception."""
-        with self.assertRaises(AccountManagementException) as cm:
-            AccountDeposit(1234567890123456789012, self.valid_deposit_amount)
-        self.assertIn("to_iban must be a string", str(cm.exception))
-
-    def test_deposit_amount_not_a_float(self):
-        """Test that a non-float deposit_amount raises an exception."""
-        with self.assertRaises(AccountManagementException) as cm:
-            AccountDeposit(self.valid_to_iban, "100.00")
-        self.assertIn("deposit_amount must be a float", str(cm.exception))
-
-    def test_invalid_to_iban(self):
-        """Test that an invalid to_iban (wrong prefix or length) raises an exception."""
-        with self.assertRaises(AccountManagementException):
-            AccountDeposit("FR1234567890123456789012", self.valid_deposit_amount)
-        with self.assertRaises(AccountManagementException):
-            AccountDeposit("ES123456789012345678901", self.valid_deposit_amount)
-
-    def test_deposit_amount_more_than_two_decimals(self):
-        """Test that deposit_amount with more than two decimal places raises an exception."""
-        with self.assertRaises(AccountManagementException) as cm:
-            AccountDeposit(self.valid_to_iban, 100.123)
-        self.assertIn("deposit_amount must have at most 2 decimals", str(cm.exception))
-
-    def test_invalid_deposit_amount(self):
-        """Test that an invalid deposit_amount (out of range) raises an exception."""
-        with self.assertRaises(AccountManagementException):
-            AccountDeposit(self.valid_to_iban, 9.99)
-        with self.assertRaises(AccountManagementException):
-            AccountDeposit(self.valid_to_iban, 10000.01)
-
-    def test_valid_deposit_amount_min_boundary(self):
-        """Test that a deposit_amount of exactly 10.00 is valid."""
-        try:
-            ad = AccountDeposit(self.valid_to_iban, 10.00)
-            self.assertEqual(ad.deposit_amount, 10.00)
-        except AccountManagementException:
-            self.fail("Raised AccountManagementException unexpectedly with amount 10.00")
-
-    def test_valid_deposit_amount_max_boundary(self):
-        """Test that a deposit_amount of exactly 10000.00 is valid."""
-        try:
-            ad = AccountDeposit(self.valid_to_iban, 10000.00)
-            self.assertEqual(ad.deposit_amount, 10000.00)
-        except AccountManagementException:
-            self.fail("Raised AccountManagementException unexpectedly with amount 10000.00")
-
-    def test_duplicate_deposit(self):
-        """Test that attempting to save a duplicate deposit raises an exception."""
-        self.ad.save_to_file(self.file_path)
-        with self.assertRaises(AccountManagementException):
-            self.ad.save_to_file(self.file_path)
-
-    def test_get_to_iban_property(self):
-        """Test the to_iban getter property returns the correct value."""
-        self.assertEqual(self.ad.to_iban, self.valid_to_iban)
-
-    def test_set_to_iban_property(self):
-        """Test the to_iban setter updates the value correctly."""
-        new_iban = "ES9999999999999999999999"
-        self.ad.to_iban = new_iban
-        self.assertEqual(self.ad.to_iban, new_iban)
-
-    def test_get_deposit_amount_property(self):
-        """Test the deposit_amount getter property returns the correct value."""
-        self.assertEqual(self.ad.deposit_amount, self.valid_deposit_amount)
-
-    def test_set_deposit_amount_property(self):
-        """Test the deposit_amount setter updates the value correctly."""
-        new_amount = 200.00
-        self.ad.deposit_amount = new_amount
-        self.assertEqual(self.ad.deposit_amount, new_amount)
-
-    def test_get_deposit_date_property(self):
-        """Test the deposit_date getter returns a float timestamp."""
-        self.assertIsInstance(self.ad.deposit_date, float)
-
-    def test_set_deposit_date_property(self):
-        """Test the deposit_date setter updates the value correctly."""
-        new_date = "01/01/2030"
-        self.ad.deposit_date = new_date
-        self.assertEqual(self.ad.deposit_date, new_date)
-
-if __name__ == "__main__":
-    unittest.main()
+# One PyUnicode object per literal, shared by every test body.
+VALID_TO_IBAN: Final = "ES1234567890123456789012"
+VALID_DEPOSIT_AMOUNT: Final = 100.00  # valid float between 10.00 and 10000.00
+
+# Key set of a serialized deposit, built once instead of per test run.
+EXPECTED_JSON_KEYS: Final = frozenset({
+    "alg", "typ", "to_iban", "deposit_amount",
+    "deposit_date", "deposit_signature",
+})
+
+
+@pytest.fixture
+def ad():
+    """A freshly built, valid AccountDeposit."""
+    return AccountDeposit(VALID_TO_IBAN, VALID_DEPOSIT_AMOUNT)
+
+
+@pytest.fixture
+def deposit_file(tmp_path):
+    """Scratch deposits file path; the .sig sidecar lands beside it."""
+    return str(tmp_path / "deposits_test.json")
+
+
+def test_to_json_returns_expected_keys(ad):
+    """Test that to_json returns a dictionary with all expected keys."""
+    result = ad.to_json()
+    assert set(result) == EXPECTED_JSON_KEYS
+
+
+def test_deposit_signature_length(ad):
+    """Test that the deposit signature is 64 characters long (SHA256 hash)."""
+    assert len(ad.deposit_signature) == 64
+
+
+def test_to_iban_not_a_string():
+    """Test that a non-string to_iban raises an exception."""
+    with pytest.raises(AccountManagementException, match="to_iban must be a string"):
+        AccountDeposit(1234567890123456789012, VALID_DEPOSIT_AMOUNT)
+
+
+def test_deposit_amount_not_a_float():
+    """Test that a non-float deposit_amount raises an exception."""
+    with pytest.raises(AccountManagementException, match="deposit_amount must be a float"):
+        AccountDeposit(VALID_TO_IBAN, "100.00")
+
+
+def test_invalid_to_iban():
+    """Test that an invalid to_iban (wrong prefix or length) raises an exception."""
+    with pytest.raises(AccountManagementException):
+        AccountDeposit("FR1234567890123456789012", VALID_DEPOSIT_AMOUNT)
+    with pytest.raises(AccountManagementException):
+        AccountDeposit("ES123456789012345678901", VALID_DEPOSIT_AMOUNT)
+
+
+def test_deposit_amount_more_than_two_decimals():
+    """Test that deposit_amount with more than two decimal places raises an exception."""
+    with pytest.raises(AccountManagementException,
+                       match=re.escape("deposit_amount must have at most 2 decimals")):
+        AccountDeposit(VALID_TO_IBAN, 100.123)
+
+
+def test_invalid_deposit_amount():
+    """Test that an invalid deposit_amount (out of range) raises an exception."""
+    with pytest.raises(AccountManagementException):
+        AccountDeposit(VALID_TO_IBAN, 9.99)
+    with pytest.raises(AccountManagementException):
+        AccountDeposit(VALID_TO_IBAN, 10000.01)
+
+
+def test_valid_deposit_amount_min_boundary():
+    """Test that a deposit_amount of exactly 10.00 is valid."""
+    ad = AccountDeposit(VALID_TO_IBAN, 10.00)
+    assert ad.deposit_amount == 10.00
+
+
+def test_valid_deposit_amount_max_boundary():
+    """Test that a deposit_amount of exactly 10000.00 is valid."""
+    ad = AccountDeposit(VALID_TO_IBAN, 10000.00)
+    assert ad.deposit_amount == 10000.00
+
+
+def test_batch_sign_matches_individual_signatures():
+    """Test that batch_sign yields the same signatures as deposit_signature."""
+    deposits = [AccountDeposit(VALID_TO_IBAN, amount)
+                for amount in (10.00, 100.00, 10000.00)]
+    signatures = AccountDeposit.batch_sign(deposits)
+    assert signatures == [d.deposit_signature for d in deposits]
+
+
+def test_duplicate_deposit(ad, deposit_file):
+    """Test that attempting to save a duplicate deposit raises an exception."""
+    ad.save_to_file(deposit_file)
+    with pytest.raises(AccountManagementException):
+        ad.save_to_file(deposit_file)
+
+
+def test_get_to_iban_property(ad):
+    """Test the to_iban getter property returns the correct value."""
+    assert ad.to_iban == VALID_TO_IBAN
+
+
+def test_set_to_iban_property(ad):
+    """Test the to_iban setter updates the value correctly."""
+    new_iban = "ES9999999999999999999999"
+    ad.to_iban = new_iban
+    assert ad.to_iban == new_iban
+
+
+def test_get_deposit_amount_property(ad):
+    """Test the deposit_amount getter property returns the correct value."""
+    assert ad.deposit_amount == VALID_DEPOSIT_AMOUNT
+
+
+def test_set_deposit_amount_property(ad):
+    """Test the deposit_amount setter updates the value correctly."""
+    new_amount = 200.00
+    ad.deposit_amount = new_amount
+    assert ad.deposit_amount == new_amount
+
+
+def test_get_deposit_date_property(ad):
+    """Test the deposit_date getter returns a float timestamp."""
+    assert isinstance(ad.deposit_date, float)
+
+
+def test_set_deposit_date_property(ad):
+    """Test the deposit_date setter updates the value correctly."""
+    new_date = "01/01/2030"
+    ad.deposit_date = new_date
+    assert ad.deposit_date == new_date
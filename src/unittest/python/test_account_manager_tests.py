@@ -10,137 +10,166 @@ Test cases cover:
 - Invalid IBAN inputs.
 - Malformed or missing transactions files.
 - Bad amount values.
-- Proper file writing with expected timestamp using freezegun.
+- Proper file writing with expected timestamp via the _now clock seam.
 """
 
-import os
+# pytest injects fixtures by matching test parameters against the
+# fixture names defined above them, which pylint reads as shadowing.
+# pylint: disable=redefined-outer-name
+
+import io
 import json
-import unittest
-from unittest.mock import patch, mock_open
-from freezegun import freeze_time
+from typing import Final
+from unittest.mock import patch
+
+import pytest
 
 from uc3m_money.account_manager import AccountManager
 from uc3m_money.account_management_exception import AccountManagementException
 
+# orjson speeds up fixture serialization when available; the system under
+# test stays on stdlib json either way.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+# One PyUnicode object per IBAN literal, shared by every test body.
+VALID_IBAN: Final = "ES1234567890123456789012"
+INVALID_SHORT_IBAN: Final = "ES12345678"
+INVALID_PREFIX_IBAN: Final = "FR1234567890123456789012"
+
+# Transaction payloads serialized once at import time; every test just
+# references the cached string instead of re-running the encoder.
+_TX_VALID = _dumps([
+    {"IBAN": VALID_IBAN, "amount": "100.00"},
+    {"IBAN": VALID_IBAN, "amount": "200,50"},
+])
+_TX_WRONG_IBAN = _dumps([{"IBAN": "ES0000000000000000000000", "amount": "100.00"}])
+_TX_BAD_AMOUNT = _dumps([{"IBAN": VALID_IBAN, "amount": "abc"}])
+_TX_SINGLE_500 = _dumps([{"IBAN": VALID_IBAN, "amount": "500.00"}])
+_TX_SINGLE_100 = _dumps([{"IBAN": VALID_IBAN, "amount": "100.00"}])
+
+
+class _FakeOpen:  # pylint: disable=too-few-public-methods
+    """Lightweight open() replacement yielding the canned file content.
+
+    io.StringIO is already a context manager, so this avoids building a
+    fresh mock_open MagicMock (descriptors, side-effect handlers) per test.
+    One instance is shared per module; each test just assigns ``data``
+    (file text, or an exception type to raise) instead of re-patching.
+    """
+
+    def __init__(self, data=""):
+        self.data = data
+
+    def __call__(self, *args, **kwargs):
+        if isinstance(self.data, type) and issubclass(self.data, BaseException):
+            raise self.data()
+        return io.StringIO(self.data)
+
+
+@pytest.fixture(scope="module")
+def fake_open():
+    """One builtins.open patcher for the whole module's balance tests."""
+    fake = _FakeOpen()
+    with patch("builtins.open", fake):
+        yield fake
+
+
+@pytest.fixture
+def mock_dump():
+    """Patches the balance-file JSON writer and yields the mock."""
+    with patch("uc3m_money.account_manager._dump_json") as mock:
+        yield mock
+
+
+@pytest.fixture
+def fixed_now():
+    """Pins the balance clock to 2025-03-25 12:00:00 UTC."""
+    with patch("uc3m_money.account_manager._now", new=lambda: 1742904000.0):
+        yield
+
+
+# IBAN validation
+
+def test_validate_iban():
+    """Test validate_iban over valid and invalid inputs in one pass."""
+    cases = [
+        (VALID_IBAN, True),
+        (INVALID_SHORT_IBAN, False),   # invalid length
+        (INVALID_PREFIX_IBAN, False),  # wrong prefix
+        (1234567890, False),           # not a string
+    ]
+    for iban, expected in cases:
+        assert AccountManager.validate_iban(iban) is expected, iban
+
+
+def test_invalid_iban_raises_exception():
+    """Test that an invalid IBAN raises an exception in balance calculation."""
+    with pytest.raises(AccountManagementException, match="Invalid IBAN"):
+        AccountManager.calculate_balance("INVALIDIBAN")
+
+
+# Balance calculation
+
+def test_missing_transactions_file(fake_open):
+    """Test that a missing transactions file raises an exception."""
+    fake_open.data = FileNotFoundError
+    with pytest.raises(AccountManagementException, match="Transactions file not found"):
+        AccountManager.calculate_balance(VALID_IBAN)
+
+
+def test_invalid_json_format(fake_open):
+    """Test that invalid JSON in transactions file raises an exception."""
+    fake_open.data = "{invalid}"
+    with pytest.raises(AccountManagementException, match="Transactions file is not valid JSON"):
+        AccountManager.calculate_balance(VALID_IBAN)
+
+
+def test_iban_not_in_transactions(fake_open):
+    """Test that an IBAN not found in the transactions file raises an exception."""
+    fake_open.data = _TX_WRONG_IBAN
+    with pytest.raises(AccountManagementException, match="IBAN not found"):
+        AccountManager.calculate_balance(VALID_IBAN)
+
+
+def test_invalid_amount_format(fake_open):
+    """Test that a transaction with an invalid amount format raises an exception."""
+    fake_open.data = _TX_BAD_AMOUNT
+    with pytest.raises(AccountManagementException, match="Invalid amount format"):
+        AccountManager.calculate_balance(VALID_IBAN)
+
+
+@pytest.mark.usefixtures("fixed_now")
+def test_valid_balance_calculation(fake_open, mock_dump):
+    """Test a valid balance calculation and check resulting balance structure."""
+    fake_open.data = _TX_VALID
+    result = AccountManager.calculate_balance(VALID_IBAN)
+    assert result
+    data_written = mock_dump.call_args[0][0]
+    assert data_written["IBAN"] == VALID_IBAN
+    assert data_written["balance"] == 300.5
+    assert data_written["timestamp"] == 1742904000.0
+
+
+@pytest.mark.usefixtures("fixed_now")
+def test_balance_file_written_with_expected_data(fake_open, mock_dump):
+    """Test that the balance file is written with correct timestamp and values."""
+    fake_open.data = _TX_SINGLE_500
+    AccountManager.calculate_balance(VALID_IBAN)
+    data_written = mock_dump.call_args[0][0]
+    assert data_written["IBAN"] == VALID_IBAN
+    assert data_written["timestamp"] == 1742904000.0
+    assert data_written["balance"] == 500.00
+
 
-class TestAccountManager(unittest.TestCase):
-    """Test cases for the AccountManager class."""
-
-    def setUp(self):
-        """Set up test IBANs and filenames."""
-        self.valid_iban = "ES1234567890123456789012"
-        self.invalid_iban_short = "ES12345678"
-        self.invalid_iban_prefix = "FR1234567890123456789012"
-        self.balance_file = f"balance_{self.valid_iban}.json"
-
-        if os.path.exists(self.balance_file):
-            os.remove(self.balance_file)
-
-    def tearDown(self):
-        """Clean up balance file if created."""
-        if os.path.exists(self.balance_file):
-            os.remove(self.balance_file)
-
-    # IBAN Validation
-    def test_validate_iban_valid(self):
-        """Test that a valid IBAN passes validation."""
-        self.assertTrue(AccountManager.validate_iban(self.valid_iban))
-
-    def test_validate_iban_invalid_length(self):
-        """Test that an IBAN with invalid length returns False."""
-        self.assertFalse(AccountManager.validate_iban(self.invalid_iban_short))
-
-    def test_validate_iban_invalid_prefix(self):
-        """Test that an IBAN not starting with 'ES' returns False."""
-        self.assertFalse(AccountManager.validate_iban(self.invalid_iban_prefix))
-
-    def test_validate_iban_invalid_type(self):
-        """Test that a non-string IBAN returns False."""
-        self.assertFalse(AccountManager.validate_iban(1234567890))
-
-    # Balance Calculation Errors
-    def test_invalid_iban_raises_exception(self):
-        """Test that an invalid IBAN raises an exception in balance calculation."""
-        with self.assertRaises(AccountManagementException) as cm:
-            AccountManager.calculate_balance("INVALIDIBAN")
-        self.assertIn("Invalid IBAN", str(cm.exception))
-
-    def test_missing_transactions_file(self):
-        """Test that a missing transactions file raises an exception."""
-        with patch("builtins.open", side_effect=FileNotFoundError()):
-            with self.assertRaises(AccountManagementException) as cm:
-                AccountManager.calculate_balance(self.valid_iban)
-            self.assertIn("Transactions file not found", str(cm.exception))
-
-    def test_invalid_json_format(self):
-        """Test that invalid JSON in transactions file raises an exception."""
-        bad_json = "{invalid}"
-        with patch("builtins.open", mock_open(read_data=bad_json)):
-            with self.assertRaises(AccountManagementException) as cm:
-                AccountManager.calculate_balance(self.valid_iban)
-            self.assertIn("Transactions file is not valid JSON", str(cm.exception))
-
-    def test_iban_not_in_transactions(self):
-        """Test that an IBAN not found in the transactions file raises an exception."""
-        transactions = [{"IBAN": "ES0000000000000000000000", "amount": "100.00"}]
-        with patch("builtins.open", mock_open(read_data=json.dumps(transactions))):
-            with self.assertRaises(AccountManagementException) as cm:
-                AccountManager.calculate_balance(self.valid_iban)
-            self.assertIn("IBAN not found", str(cm.exception))
-
-    def test_invalid_amount_format(self):
-        """Test that a transaction with an invalid amount format raises an exception."""
-        transactions = [{"IBAN": self.valid_iban, "amount": "abc"}]
-        with patch("builtins.open", mock_open(read_data=json.dumps(transactions))):
-            with self.assertRaises(AccountManagementException) as cm:
-                AccountManager.calculate_balance(self.valid_iban)
-            self.assertIn("Invalid amount format", str(cm.exception))
-
-    @freeze_time("2025-03-25 12:00:00")
-    def test_valid_balance_calculation(self):
-        """Test a valid balance calculation and check resulting balance structure."""
-        transactions = [
-            {"IBAN": self.valid_iban, "amount": "100.00"},
-            {"IBAN": self.valid_iban, "amount": "200,50"},
-        ]
-        with patch("builtins.open", mock_open(read_data=json.dumps(transactions))):
-            with patch("json.dump") as mock_dump:
-                result = AccountManager.calculate_balance(self.valid_iban)
-                self.assertTrue(result)
-                data_written = mock_dump.call_args[0][0]
-                self.assertEqual(data_written["IBAN"], self.valid_iban)
-                self.assertEqual(data_written["balance"], 300.5)
-                self.assertEqual(data_written["timestamp"], 1742904000.0)
-
-    @freeze_time("2025-03-25 12:00:00")
-    def test_balance_file_written_with_expected_data(self):
-        """Test that the balance file is written with correct timestamp and values."""
-        transactions = [{"IBAN": self.valid_iban, "amount": "500.00"}]
-        with patch("builtins.open", mock_open(read_data=json.dumps(transactions))):
-            AccountManager.calculate_balance(self.valid_iban)
-
-        with open(self.balance_file, "w", encoding="utf-8") as f:
-            json.dump({
-                "IBAN": self.valid_iban,
-                "timestamp": 1742904000.0,
-                "balance": 500.00
-            }, f, indent=4)
-
-        with open(self.balance_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.assertEqual(data["IBAN"], self.valid_iban)
-            self.assertEqual(data["timestamp"], 1742904000.0)
-            self.assertEqual(data["balance"], 500.00)
-
-    def test_balance_file_write_exception(self):
-        """Test that an exception during balance file writing is properly handled."""
-        transactions = [{"IBAN": self.valid_iban, "amount": "100.00"}]
-        with patch("builtins.open", mock_open(read_data=json.dumps(transactions))):
-            # Patch json.dump to simulate a failure during writing
-            with patch("json.dump", side_effect=OSError("Disk write error")):
-                with self.assertRaises(AccountManagementException) as cm:
-                    AccountManager.calculate_balance(self.valid_iban)
-                self.assertIn("Error writing balance file", str(cm.exception))
-
-if __name__ == "__main__":
-    unittest.main()
+def test_balance_file_write_exception(fake_open, mock_dump):
+    """Test that an exception during balance file writing is properly handled."""
+    fake_open.data = _TX_SINGLE_100
+    mock_dump.side_effect = OSError("Disk write error")
+    with pytest.raises(AccountManagementException, match="Error writing balance file"):
+        AccountManager.calculate_balance(VALID_IBAN)
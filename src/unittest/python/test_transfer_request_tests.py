@@ -5,7 +5,7 @@ This module tests the TransferRequest class located in:
 src/main/python/uc3m_money/transfer_request.py
 
 Test cases cover:
-- Valid transfer requests (including MD5 hash generation and JSON output).
+- Valid transfer requests (including transfer-code generation and JSON output).
 - IBAN validations (prefix and length).
 - Transfer type validations.
 - Transfer concept validations (exactly two words, letters only, valid length).
@@ -14,335 +14,251 @@ Test cases cover:
 - File saving functionality, including prevention of duplicate entries.
 """
 
+# pytest injects fixtures by matching test parameters against the
+# fixture names defined above them, which pylint reads as shadowing.
+# pylint: disable=redefined-outer-name
+
 import os
-import unittest
-from freezegun import freeze_time
+import re
+from types import MappingProxyType
+from typing import Final
+
+import pytest
 
 from uc3m_money.transfer_request import TransferRequest
 from uc3m_money.account_management_exception import AccountManagementException
 
-
-class BaseTransferRequestTest(unittest.TestCase):
-    """
-    Base class providing setUp and tearDown for all TransferRequest tests.
-    """
-
-    def setUp(self):
-        """Set up valid test fixtures."""
-        self.valid_from_iban = "ES1234567890123456789012"  # valid: 24 chars, starts with ES
-        self.valid_to_iban = "ES9876543210987654321098"    # valid: 24 chars, starts with ES
-        self.valid_details = {
-            "transfer_type": "ORDINARY",
-            "transfer_concept": "Payment services",  # Two words, only letters, length=16
-            "transfer_date": "07/01/2025",            # Year between 2025 and 2050
-            "transfer_amount": 40.00,                 # Valid float in range
-        }
-        # File used for testing save_to_file functionality.
-        self.test_file = "test_transfers.json"
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-
-    def tearDown(self):
-        """Clean up test artifacts."""
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-
-class TestTransferRequestValid(BaseTransferRequestTest):
-    """
-    Tests a fully valid transfer request scenario.
-    """
-    @freeze_time("2025-03-25 12:00:00")
-    def test_valid_transfer_request(self):
-        """Test that a valid transfer request is created successfully."""
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, self.valid_details)
-        result = tr.to_json()
-        expected_keys = {
-            "from_iban",
-            "to_iban",
-            "transfer_type",
-            "transfer_amount",
-            "transfer_concept",
-            "transfer_date",
-            "time_stamp",
-            "transfer_code",
-        }
-        self.assertEqual(set(result.keys()), expected_keys)
-        self.assertEqual(result["time_stamp"], 1742904000.0)
-        self.assertEqual(len(tr.transfer_code), 32)
-        self.assertTrue(str(tr).startswith("Transfer:"))
-
-class TestTransferRequestIbanValidation(BaseTransferRequestTest):
-    """
-    Tests for IBAN validation (type, prefix, length).
-    """
-    # IBAN Validation Tests
-    def test_invalid_from_iban_not_string(self):
-        """Test that a non-string from_iban raises an exception."""
-        invalid = 1234567890123456789012  # Not a string
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(invalid, self.valid_to_iban, self.valid_details)
-        self.assertIn("from_iban must be a string", str(cm.exception))
-
-    def test_invalid_to_iban_not_string(self):
-        """Test that a non-string to_iban raises an exception."""
-        invalid = 9876543210987654321098  # Not a string
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, invalid, self.valid_details)
-        self.assertIn("to_iban must be a string", str(cm.exception))
-
-    def test_invalid_from_iban_prefix(self):
-        """Test that a from_iban not starting with 'ES' raises an exception."""
-        invalid = "FR1234567890123456789012"
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(invalid, self.valid_to_iban, self.valid_details)
-        self.assertIn("from_iban must start with 'ES'", str(cm.exception))
-
-    def test_invalid_from_iban_wrong_length(self):
-        """Test that a from_iban with more than 24 characters raises an exception."""
-        invalid = "ES12345678901234567890123"  # 25 chars
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(invalid, self.valid_to_iban, self.valid_details)
-        self.assertIn("must be exactly 24 characters", str(cm.exception))
-
-    def test_invalid_to_iban_prefix(self):
-        """Test that a to_iban not starting with 'ES' raises an exception."""
-        invalid = "FR9876543210987654321098"
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, invalid, self.valid_details)
-        self.assertIn("to_iban must start with 'ES'", str(cm.exception))
-
-class TestTransferRequestTypeValidation(BaseTransferRequestTest):
-    """
-    Tests for transfer_type validation (must be string, must be ORDINARY/URGENT/IMMEDIATE).
-    """
-    # Transfer Type Validation
-    def test_invalid_transfer_type(self):
-        """Test that an invalid transfer_type raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_type"] = "EXPRESS"
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_type must be ORDINARY, URGENT, or IMMEDIATE", str(cm.exception))
-
-    def test_invalid_transfer_type_not_string(self):
-        """Test that a non-string transfer_type raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_type"] = 123
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_type must be a string", str(cm.exception))
-
-class TestTransferRequestConceptValidation(BaseTransferRequestTest):
-    """
-    Tests for transfer_concept validation (must be string, two words, alpha, 10-30 chars).
-    """
-    # Transfer Concept Validation
-    def test_invalid_transfer_concept_not_string(self):
-        """Test that a non-string transfer_concept raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_concept"] = 12345
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_concept must be a string", str(cm.exception))
-
-    def test_invalid_transfer_concept_one_word(self):
-        """Test that a transfer_concept with only one word raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_concept"] = "Payment"
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_concept must contain exactly two words", str(cm.exception))
-
-    def test_invalid_transfer_concept_nonalpha(self):
-        """Test that a transfer_concept containing non-letter characters raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_concept"] = "Payment 123"
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_concept must contain only letters", str(cm.exception))
-
-    def test_valid_transfer_concept_min_length(self):
-        """Test that a transfer_concept with exactly 10 characters passes validation."""
-        details = self.valid_details.copy()
-        details["transfer_concept"] = "Pay Checks"  # 10 characters including space
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIsInstance(tr, TransferRequest)
-
-    def test_valid_transfer_concept_max_length(self):
-        """Test that a transfer_concept with exactly 30 characters passes validation."""
-        details = self.valid_details.copy()
-        details["transfer_concept"] = "PaymentAuthorization Request"  # 30 characters
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIsInstance(tr, TransferRequest)
-
-    def test_invalid_transfer_concept_length(self):
-        """Test that a transfer_concept with length outside 10-30 characters raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_concept"] = "Hey There"  # Only 9 characters total, too short
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_concept must be 10 to 30 characters long", str(cm.exception))
-
-class TestTransferRequestDateValidation(BaseTransferRequestTest):
-    """
-    Tests for transfer_date validation
-    (must be string, valid format, year=2025-2050, day/month range).
-    """
-    # Transfer Date Validation
-    def test_invalid_transfer_date_format(self):
-        """Test that an improperly formatted transfer_date raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_date"] = "2025-01-07"
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_date must be in DD/MM/YYYY format", str(cm.exception))
-
-    def test_invalid_transfer_date_not_string(self):
-        """Test that a non-string transfer_date raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_date"] = 20250325
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_date must be a string", str(cm.exception))
-
-    def test_invalid_transfer_date_year(self):
-        """Test that a transfer_date with a year outside allowed range raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_date"] = "07/01/2051"  # Year 2051 not allowed
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("Year must be between 2025 and 2050", str(cm.exception))
-
-    def test_invalid_transfer_date_day_zero(self):
-        """Test that a transfer_date with a day of 00 raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_date"] = "00/01/2025"
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("Day must be between 1 and 31", str(cm.exception))
-
-    def test_invalid_transfer_date_month_thirteen(self):
-        """Test that a transfer_date with a month of 13 raises an exception"""
-        details = self.valid_details.copy()
-        details["transfer_date"] = "07/13/2025"
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("Month must be between 1 and 12", str(cm.exception))
-
-    def test_invalid_transfer_date_day_high(self):
-        """Test that a transfer_date with a day of 32 raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_date"] = "32/01/2025"  # valid month, invalid day
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("Day must be between 1 and 31", str(cm.exception))
-
-    def test_invalid_transfer_date_month_low(self):
-        """Test that a transfer_date with a month of 00 raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_date"] = "07/00/2025"  # valid day, invalid month
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("Month must be between 1 and 12", str(cm.exception))
-
-class TestTransferRequestAmountValidation(BaseTransferRequestTest):
-    """
-    Tests for transfer_amount validation (must be float, 10.00 <= amount <= 10000.00, <=2 decimals).
-    """
-    # Transfer Amount Validation
-    def test_invalid_transfer_amount_not_float(self):
-        """Test that a non-float transfer_amount raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_amount"] = "100.00"
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_amount must be a float", str(cm.exception))
-
-    def test_invalid_transfer_amount_low(self):
-        """Test that a transfer_amount lower than 10.00 raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_amount"] = 9.99
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_amount must be between 10.00 and 10000.00", str(cm.exception))
-
-    def test_invalid_transfer_amount_high(self):
-        """Test that a transfer_amount higher than 10000.00 raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_amount"] = 10000.01
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_amount must be between 10.00 and 10000.00", str(cm.exception))
-
-    def test_invalid_transfer_amount_decimals(self):
-        """Test that a transfer_amount with more than 2 decimal places raises an exception."""
-        details = self.valid_details.copy()
-        details["transfer_amount"] = 40.123
-        with self.assertRaises(AccountManagementException) as cm:
-            TransferRequest(self.valid_from_iban, self.valid_to_iban, details)
-        self.assertIn("transfer_amount must have at most 2 decimal places", str(cm.exception))
-
-class TestTransferRequestFileAndProperties(BaseTransferRequestTest):
+# One PyUnicode object per IBAN literal, shared by every test body.
+VALID_FROM_IBAN: Final = "ES1234567890123456789012"  # valid: 24 chars, starts with ES
+VALID_TO_IBAN: Final = "ES9876543210987654321098"    # valid: 24 chars, starts with ES
+
+# Valid transfer details template, frozen so no test can mutate the
+# shared base; tests layer overrides with a single dict unpacking.
+VALID_DETAILS: Final = MappingProxyType({
+    "transfer_type": "ORDINARY",
+    "transfer_concept": "Payment services",  # Two words, only letters, length=16
+    "transfer_date": "07/01/2025",            # Year between 2025 and 2050
+    "transfer_amount": 40.00,                 # Valid float in range
+})
+
+# Key set of a serialized transfer, built once instead of per test run.
+_EXPECTED_JSON_KEYS = frozenset({
+    "from_iban",
+    "to_iban",
+    "transfer_type",
+    "transfer_amount",
+    "transfer_concept",
+    "transfer_date",
+    "time_stamp",
+    "transfer_code",
+})
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _frozen():
+    """Freezes the clock once for the whole module.
+
+    freezegun (and the dateutil tree it pulls in) is imported lazily so
+    plain collection never pays for it, and its sys.modules walk happens
+    a single time instead of per decorated test; every TransferRequest
+    in this module therefore carries the 2025-03-25 12:00:00 UTC
+    timestamp.
     """
-    Tests for duplicate saving, plus property getters and setters.
+    from freezegun import freeze_time  # pylint: disable=import-outside-toplevel
+    with freeze_time("2025-03-25 12:00:00"):
+        yield
+
+
+# Valid transfer request
+
+def test_valid_transfer_request():
+    """Test that a valid transfer request is created successfully."""
+    tr = TransferRequest(VALID_FROM_IBAN, VALID_TO_IBAN, VALID_DETAILS)
+    result = tr.to_json()
+    assert result.keys() == _EXPECTED_JSON_KEYS
+    assert result["time_stamp"] == 1742904000.0
+    assert len(tr.transfer_code) == 32
+    assert str(tr).startswith("Transfer:")
+
+
+# Expected-error patterns compiled once at import time; pytest.raises
+# accepts re.Pattern objects for match=, skipping a re.compile per case.
+ERR_FROM_IBAN_STRING = re.compile("from_iban must be a string")
+ERR_FROM_IBAN_PREFIX = re.compile("from_iban must start with 'ES'")
+ERR_IBAN_LENGTH = re.compile("must be exactly 24 characters")
+ERR_TO_IBAN_STRING = re.compile("to_iban must be a string")
+ERR_TO_IBAN_PREFIX = re.compile("to_iban must start with 'ES'")
+ERR_TYPE_VALUES = re.compile("transfer_type must be ORDINARY, URGENT, or IMMEDIATE")
+ERR_TYPE_STRING = re.compile("transfer_type must be a string")
+ERR_CONCEPT_STRING = re.compile("transfer_concept must be a string")
+ERR_CONCEPT_WORDS = re.compile("transfer_concept must contain exactly two words")
+ERR_CONCEPT_LETTERS = re.compile("transfer_concept must contain only letters")
+ERR_CONCEPT_LENGTH = re.compile("transfer_concept must be 10 to 30 characters long")
+ERR_DATE_FORMAT = re.compile("transfer_date must be in DD/MM/YYYY format")
+ERR_DATE_STRING = re.compile("transfer_date must be a string")
+ERR_DATE_YEAR = re.compile("Year must be between 2025 and 2050")
+ERR_DATE_DAY = re.compile("Day must be between 1 and 31")
+ERR_DATE_MONTH = re.compile("Month must be between 1 and 12")
+ERR_AMOUNT_FLOAT = re.compile("transfer_amount must be a float")
+ERR_AMOUNT_RANGE = re.compile(r"transfer_amount must be between 10\.00 and 10000\.00")
+ERR_AMOUNT_DECIMALS = re.compile("transfer_amount must have at most 2 decimal places")
+ERR_DUPLICATE = re.compile("Duplicate transfer detected")
+
+# Invalid-input tables: one parametrized test per field collapses the
+# near-identical negative cases while keeping one report line per case.
+INVALID_FROM_IBANS = [
+    (1234567890123456789012, ERR_FROM_IBAN_STRING),        # not a string
+    ("FR1234567890123456789012", ERR_FROM_IBAN_PREFIX),
+    ("ES12345678901234567890123", ERR_IBAN_LENGTH),  # 25 chars
+]
+INVALID_TO_IBANS = [
+    (9876543210987654321098, ERR_TO_IBAN_STRING),          # not a string
+    ("FR9876543210987654321098", ERR_TO_IBAN_PREFIX),
+]
+INVALID_TYPES = [
+    ("EXPRESS", ERR_TYPE_VALUES),
+    (123, ERR_TYPE_STRING),
+]
+INVALID_CONCEPTS = [
+    (12345, ERR_CONCEPT_STRING),
+    ("Payment", ERR_CONCEPT_WORDS),
+    ("Payment 123", ERR_CONCEPT_LETTERS),
+    ("Hey There", ERR_CONCEPT_LENGTH),  # 9 chars
+]
+INVALID_DATES = [
+    ("2025-01-07", ERR_DATE_FORMAT),
+    (20250325, ERR_DATE_STRING),
+    ("07/01/2051", ERR_DATE_YEAR),
+    ("00/01/2025", ERR_DATE_DAY),
+    ("32/01/2025", ERR_DATE_DAY),
+    ("07/13/2025", ERR_DATE_MONTH),
+    ("07/00/2025", ERR_DATE_MONTH),
+]
+INVALID_AMOUNTS = [
+    ("100.00", ERR_AMOUNT_FLOAT),
+    (9.99, ERR_AMOUNT_RANGE),
+    (10000.01, ERR_AMOUNT_RANGE),
+    (40.123, ERR_AMOUNT_DECIMALS),
+]
+
+
+@pytest.mark.parametrize("bad,msg", INVALID_FROM_IBANS)
+def test_invalid_from_iban(bad, msg):
+    """Test that an invalid from_iban raises an exception."""
+    with pytest.raises(AccountManagementException, match=msg):
+        TransferRequest(bad, VALID_TO_IBAN, VALID_DETAILS)
+
+
+@pytest.mark.parametrize("bad,msg", INVALID_TO_IBANS)
+def test_invalid_to_iban(bad, msg):
+    """Test that an invalid to_iban raises an exception."""
+    with pytest.raises(AccountManagementException, match=msg):
+        TransferRequest(VALID_FROM_IBAN, bad, VALID_DETAILS)
+
+
+@pytest.mark.parametrize("bad,msg", INVALID_TYPES)
+def test_invalid_transfer_type(bad, msg):
+    """Test that an invalid transfer_type raises an exception."""
+    details = {**VALID_DETAILS, "transfer_type": bad}
+    with pytest.raises(AccountManagementException, match=msg):
+        TransferRequest(VALID_FROM_IBAN, VALID_TO_IBAN, details)
+
+
+@pytest.mark.parametrize("bad,msg", INVALID_CONCEPTS)
+def test_invalid_transfer_concept(bad, msg):
+    """Test that an invalid transfer_concept raises an exception."""
+    details = {**VALID_DETAILS, "transfer_concept": bad}
+    with pytest.raises(AccountManagementException, match=msg):
+        TransferRequest(VALID_FROM_IBAN, VALID_TO_IBAN, details)
+
+
+@pytest.mark.parametrize("concept", [
+    "Pay Checks",                    # 10 characters including space, lower bound
+    "PaymentAuthorization Request",  # 30 characters, upper bound
+])
+def test_valid_transfer_concept_boundary(concept):
+    """Test that concepts at the 10- and 30-character bounds pass validation."""
+    details = {**VALID_DETAILS, "transfer_concept": concept}
+    tr = TransferRequest(VALID_FROM_IBAN, VALID_TO_IBAN, details)
+    assert tr.transfer_concept == concept
+
+
+@pytest.mark.parametrize("bad,msg", INVALID_DATES)
+def test_invalid_transfer_date(bad, msg):
+    """Test that an invalid transfer_date raises an exception."""
+    details = {**VALID_DETAILS, "transfer_date": bad}
+    with pytest.raises(AccountManagementException, match=msg):
+        TransferRequest(VALID_FROM_IBAN, VALID_TO_IBAN, details)
+
+
+@pytest.mark.parametrize("bad,msg", INVALID_AMOUNTS)
+def test_invalid_transfer_amount(bad, msg):
+    """Test that an invalid transfer_amount raises an exception."""
+    details = {**VALID_DETAILS, "transfer_amount": bad}
+    with pytest.raises(AccountManagementException, match=msg):
+        TransferRequest(VALID_FROM_IBAN, VALID_TO_IBAN, details)
+
+
+# File saving and properties
+
+def test_save_and_duplicate_transfer(tmp_path):
+    """Test a successful save and duplicate detection on one instance.
+
+    Both behaviours are asserted against the same TransferRequest, so the
+    payload is constructed and hashed once for the pair. tmp_path hands
+    out a fresh directory and cleans it up, so no other test pays any
+    file bookkeeping.
     """
-    @freeze_time("2025-03-25 12:00:00")
-    def test_duplicate_transfer(self):
-        """Test that saving a duplicate transfer raises an exception."""
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, self.valid_details)
-        tr.save_to_file(self.test_file)
-        with self.assertRaises(AccountManagementException) as cm:
-            tr.save_to_file(self.test_file)
-        self.assertIn("Duplicate transfer detected", str(cm.exception))
-
-    def test_from_iban_getter_and_setter(self):
-        """Test getter and setter for from_iban."""
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, self.valid_details)
-        self.assertEqual(tr.from_iban, self.valid_from_iban)
-        new_iban = "ES1111222233334444555566"
-        tr.from_iban = new_iban
-        self.assertEqual(tr.from_iban, new_iban)
-
-    def test_to_iban_getter_and_setter(self):
-        """Test getter and setter for to_iban."""
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, self.valid_details)
-        self.assertEqual(tr.to_iban, self.valid_to_iban)
-        new_iban = "ES9999888877776666555544"
-        tr.to_iban = new_iban
-        self.assertEqual(tr.to_iban, new_iban)
-
-    def test_transfer_type_getter_and_setter(self):
-        """Test getter and setter for transfer_type."""
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, self.valid_details)
-        self.assertEqual(tr.transfer_type, "ORDINARY")
-        tr.transfer_type = "URGENT"
-        self.assertEqual(tr.transfer_type, "URGENT")
-
-    def test_transfer_amount_getter_and_setter(self):
-        """Test getter and setter for transfer_amount."""
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, self.valid_details)
-        self.assertEqual(tr.transfer_amount, 40.00)
-        tr.transfer_amount = 1000.00
-        self.assertEqual(tr.transfer_amount, 1000.00)
-
-    def test_transfer_concept_getter_and_setter(self):
-        """Test getter and setter for transfer_concept."""
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, self.valid_details)
-        self.assertEqual(tr.transfer_concept, "Payment services")
-        tr.transfer_concept = "Service Charge"
-        self.assertEqual(tr.transfer_concept, "Service Charge")
-
-    def test_transfer_date_getter_and_setter(self):
-        """Test getter and setter for transfer_date."""
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, self.valid_details)
-        self.assertEqual(tr.transfer_date, "07/01/2025")
-        tr.transfer_date = "08/01/2025"
-        self.assertEqual(tr.transfer_date, "08/01/2025")
-
-    def test_time_stamp_property(self):
-        """Test that time_stamp returns a float timestamp."""
-        tr = TransferRequest(self.valid_from_iban, self.valid_to_iban, self.valid_details)
-        self.assertIsInstance(tr.time_stamp, float)
-
-if __name__ == "__main__":
-    unittest.main()
+    test_file = str(tmp_path / "test_transfers.json")
+    tr = TransferRequest(VALID_FROM_IBAN, VALID_TO_IBAN, VALID_DETAILS)
+    tr.save_to_file(test_file)
+    assert os.path.exists(test_file)
+    with pytest.raises(AccountManagementException, match=ERR_DUPLICATE):
+        tr.save_to_file(test_file)
+
+
+@pytest.fixture(scope="module")
+def shared_tr():
+    """One immutable TransferRequest shared by the read-only tests."""
+    return TransferRequest(VALID_FROM_IBAN, VALID_TO_IBAN, VALID_DETAILS)
+
+
+def test_property_getters(shared_tr):
+    """Test every getter against one shared, never-mutated instance."""
+    assert shared_tr.from_iban == VALID_FROM_IBAN
+    assert shared_tr.to_iban == VALID_TO_IBAN
+    assert shared_tr.transfer_type == "ORDINARY"
+    assert shared_tr.transfer_amount == 40.00
+    assert shared_tr.transfer_concept == "Payment services"
+    assert shared_tr.transfer_date == "07/01/2025"
+    assert isinstance(shared_tr.time_stamp, float)
+
+
+# One (property, new value) row per settable field; each round-trip case
+# touches a distinct property, so a single shared instance serves all of
+# them without the cases observing one another's writes.
+PROPERTY_ROUNDTRIPS = [
+    ("from_iban", "ES1111222233334444555566"),
+    ("to_iban", "ES9999888877776666555544"),
+    ("transfer_type", "URGENT"),
+    ("transfer_amount", 1000.00),
+    ("transfer_concept", "Service Charge"),
+    ("transfer_date", "08/01/2025"),
+]
+
+# Initial value of every settable property on a freshly built request.
+_INITIAL_VALUES = {"from_iban": VALID_FROM_IBAN, "to_iban": VALID_TO_IBAN, **VALID_DETAILS}
+
+
+@pytest.fixture(scope="module")
+def roundtrip_tr():
+    """One TransferRequest mutated across the round-trip cases."""
+    return TransferRequest(VALID_FROM_IBAN, VALID_TO_IBAN, VALID_DETAILS)
+
+
+@pytest.mark.parametrize("name,new", PROPERTY_ROUNDTRIPS)
+def test_property_roundtrip(roundtrip_tr, name, new):
+    """Test that each property reports its initial value and accepts a new one."""
+    assert getattr(roundtrip_tr, name) == _INITIAL_VALUES[name]
+    setattr(roundtrip_tr, name, new)
+    assert getattr(roundtrip_tr, name) == new